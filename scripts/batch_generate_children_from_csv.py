@@ -1,34 +1,40 @@
 import argparse
+import asyncio
+import html
 import json
-import math
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from string import Template
 from typing import Dict, List, Tuple, Optional, Set
 
+import numpy as np
 import pandas as pd
-from pymongo import MongoClient
+from pydantic import ValidationError
+from pymongo import MongoClient, UpdateOne
 
-from src.models import ChildPageOutput
-from src.generator import generate_child_content
+from src.models import ChildPageOutput, FAQItem
+from src.generator import agenerate_child_content
 from src.mappers import build_child_mongo_doc
 from src.validation import validate_child_lengths
-from src.section_regen import regenerate_section
+from src.section_regen import SECTION_OUTPUT_KEYS, aregenerate_sections_bundle
 
 
 # ---------- CONFIG HELPERS ----------
 
+_NON_ALNUM_RE = re.compile(r"[^0-9a-zA-Z]+")
+
 # Special codes for common units; everything else will be normalized
 SPECIAL_CODES: Dict[str, str] = {
     "Square Meter": "SQ_M",
-    "Square Meter ": "SQ_M",
     "Square Meteres": "SQ_M",  # just in case of typos
     "Square Meters": "SQ_M",
     "Square Feet": "SQ_FT",
     "Square Foot": "SQ_FT",
-    " Square Feet": "SQ_FT",
-    " Square Foot": "SQ_FT",
     "Square Yard": "SQ_YD",
-    " Square Yard": "SQ_YD",
     "Square Inch": "SQ_IN",
     "Square Kilometer": "SQ_KM",
     "Square Mile": "SQ_MI",
@@ -36,6 +42,9 @@ SPECIAL_CODES: Dict[str, str] = {
     "Hectare": "HECTARE",
 }
 
+# Labels are stripped and casefolded before lookup, so spacing/case variants need no extra keys
+_SPECIAL_CODES_CF: Dict[str, str] = {k.strip().casefold(): v for k, v in SPECIAL_CODES.items()}
+
 # Map region tokens to a representative city (tweak this for SEO as you like)
 REGION_TO_CITY: Dict[str, str] = {
     "Assam": "Guwahati",
@@ -54,48 +63,42 @@ REGION_TO_CITY: Dict[str, str] = {
     "MP": "Bhopal",
 }
 
-def render_child_html_page(
-    ai_output: ChildPageOutput,
-    *,
-    slug: str,
-    from_label: str,
-    to_label: str,
-    factor: float,
-    locale: str,
-    site_code: str,
-    url_path: str,
-) -> str:
-    """Builds a simple standalone HTML page for previewing one child page."""
-    seo_title = ai_output.seo_meta_title
-    seo_desc = ai_output.seo_meta_description
-    h1 = ai_output.h1_heading
+# One case-insensitive pass over a label instead of a substring check per region
+_REGION_RE = re.compile("|".join(re.escape(k) for k in REGION_TO_CITY), re.IGNORECASE)
+_REGION_TO_CITY_LC: Dict[str, str] = {k.lower(): v for k, v in REGION_TO_CITY.items()}
 
-    canonical = f"https://www.squareyards.com{url_path}"
+# Progress can be logged from the event loop and from worker threads; keep each block in one piece.
+_print_lock = threading.Lock()
 
-    why_html = ai_output.why_convert_section_html
-    from_html = ai_output.from_unit_section_html
-    to_html = ai_output.to_unit_section_html
-    examples_html = ai_output.examples_section_html
-    tech_html = ai_output.technical_details_html
 
-    faqs_html_parts = []
-    for faq in ai_output.faqs:
-        q = faq.get("question", "")
-        ans = faq.get("answer_html", "")
-        faqs_html_parts.append(
-            f"<div class='faq-item'><h3>{q}</h3>{ans}</div>"
-        )
-    faqs_html = "\n".join(faqs_html_parts)
+def log(message: str) -> None:
+    with _print_lock:
+        print(message)
+
+
+# Preview files are written in the background so generation never waits on disk
+_io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="preview-io")
+
+
+def write_preview(html_path: Path, html_str: str) -> None:
+    try:
+        html_path.write_text(html_str, encoding="utf-8")
+    except OSError as exc:
+        log(f"Failed to write HTML preview {html_path}: {exc}")
+        return
+    log(f"HTML preview written to {html_path}")
+
 
-    return f"""<!DOCTYPE html>
+# Static parts of the HTML preview page, built once at import time
+_HTML_HEAD_TEMPLATE = Template("""<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="utf-8" />
-  <title>{seo_title}</title>
-  <meta name="description" content="{seo_desc}" />
-  <link rel="canonical" href="{canonical}" />
+  <title>$title</title>
+  <meta name="description" content="$description" />
+  <link rel="canonical" href="$canonical" />
   <style>
-    body {{
+    body {
       font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
       max-width: 960px;
       margin: 2rem auto;
@@ -103,120 +106,180 @@ def render_child_html_page(
       line-height: 1.6;
       color: #222;
       background: #fafafa;
-    }}
-    header {{
+    }
+    header {
       border-bottom: 1px solid #ddd;
       margin-bottom: 1.5rem;
       padding-bottom: 0.5rem;
-    }}
-    h1 {{
+    }
+    h1 {
       font-size: 1.9rem;
       margin-bottom: 0.5rem;
-    }}
-    h2 {{
+    }
+    h2 {
       margin-top: 2rem;
       font-size: 1.4rem;
       border-bottom: 1px solid #eee;
       padding-bottom: 0.25rem;
-    }}
-    h3 {{
+    }
+    h3 {
       margin-top: 1.25rem;
       font-size: 1.1rem;
-    }}
-    .meta {{
+    }
+    .meta {
       font-size: 0.9rem;
       color: #555;
-    }}
-    .meta span {{
+    }
+    .meta span {
       display: inline-block;
       margin-right: 1rem;
-    }}
-    .section {{
+    }
+    .section {
       margin-top: 1.5rem;
       background: #fff;
       padding: 1.25rem 1rem;
       border-radius: 6px;
       box-shadow: 0 1px 2px rgba(0,0,0,0.04);
-    }}
-    .section p {{
+    }
+    .section p {
       margin: 0.35rem 0;
-    }}
-    .faq-item {{
+    }
+    .faq-item {
       margin-bottom: 1rem;
       padding-bottom: 0.75rem;
       border-bottom: 1px dashed #e0e0e0;
-    }}
-    code {{
+    }
+    code {
       font-family: Menlo, Monaco, Consolas, "Courier New", monospace;
       background: #f3f3f3;
       padding: 0.1rem 0.25rem;
       border-radius: 3px;
       font-size: 0.85rem;
-    }}
+    }
   </style>
 </head>
-<body>
+""")
+
+_HTML_BODY_TEMPLATE = Template("""<body>
   <header>
-    <h1>{h1}</h1>
+    <h1>$h1</h1>
     <div class="meta">
-      <span><strong>Slug:</strong> {slug}</span>
-      <span><strong>URL path:</strong> {url_path}</span>
-      <span><strong>From:</strong> {from_label}</span>
-      <span><strong>To:</strong> {to_label}</span>
-      <span><strong>Factor:</strong> 1 {from_label} ≈ {factor} {to_label}</span>
-      <span><strong>Locale:</strong> {locale}</span>
-      <span><strong>Site:</strong> {site_code}</span>
+      <span><strong>Slug:</strong> $slug</span>
+      <span><strong>URL path:</strong> $url_path</span>
+      <span><strong>From:</strong> $from_label</span>
+      <span><strong>To:</strong> $to_label</span>
+      <span><strong>Factor:</strong> 1 $from_label ≈ $factor $to_label</span>
+      <span><strong>Locale:</strong> $locale</span>
+      <span><strong>Site:</strong> $site_code</span>
     </div>
   </header>
 
   <section class="section">
-    <h2>Why convert {from_label} to {to_label}?</h2>
-    {why_html}
+    <h2>Why convert $from_label to $to_label?</h2>
+    $why_html
   </section>
 
   <section class="section">
-    <h2>What is {from_label}?</h2>
-    {from_html}
+    <h2>What is $from_label?</h2>
+    $from_html
   </section>
 
   <section class="section">
-    <h2>What is {to_label}?</h2>
-    {to_html}
+    <h2>What is $to_label?</h2>
+    $to_html
   </section>
 
   <section class="section">
-    <h2>Examples: {from_label} to {to_label}</h2>
-    {examples_html}
+    <h2>Examples: $from_label to $to_label</h2>
+    $examples_html
   </section>
 
   <section class="section">
     <h2>Technical details</h2>
-    {tech_html}
+    $tech_html
   </section>
 
   <section class="section">
     <h2>FAQs</h2>
-    {faqs_html}
+    $faqs_html
   </section>
 </body>
 </html>
-"""
+""")
+
+
+def render_child_html_page(
+    ai_output: ChildPageOutput,
+    *,
+    slug: str,
+    from_label: str,
+    to_label: str,
+    factor: float,
+    locale: str,
+    site_code: str,
+    url_path: str,
+) -> str:
+    """Builds a simple standalone HTML page for previewing one child page."""
+    # Plain-text fields from the model are escaped once here; *_html fields are trusted markup
+    esc = html.escape
+    seo_title = esc(ai_output.seo_meta_title, quote=True)
+    seo_desc = esc(ai_output.seo_meta_description, quote=True)
+    h1 = esc(ai_output.h1_heading, quote=True)
+
+    canonical = f"https://www.squareyards.com{url_path}"
+
+    why_html = ai_output.why_convert_section_html
+    from_html = ai_output.from_unit_section_html
+    to_html = ai_output.to_unit_section_html
+    examples_html = ai_output.examples_section_html
+    tech_html = ai_output.technical_details_html
+
+    faqs_html = "\n".join(
+        f"<div class='faq-item'><h3>{esc(faq.question)}</h3>{faq.answer_html}</div>"
+        for faq in ai_output.faqs
+    )
+
+    head = _HTML_HEAD_TEMPLATE.substitute(
+        title=seo_title,
+        description=seo_desc,
+        canonical=canonical,
+    )
+    body = _HTML_BODY_TEMPLATE.substitute(
+        h1=h1,
+        slug=slug,
+        url_path=url_path,
+        from_label=from_label,
+        to_label=to_label,
+        factor=factor,
+        locale=locale,
+        site_code=site_code,
+        why_html=why_html,
+        from_html=from_html,
+        to_html=to_html,
+        examples_html=examples_html,
+        tech_html=tech_html,
+        faqs_html=faqs_html,
+    )
+    return head + body
 
+@lru_cache(maxsize=1024)
 def normalize_unit_code(label: str) -> str:
     """
     Turn a human-readable unit label into a code (e.g. 'Bigha – Assam' → 'BIGHA_ASSAM').
     Uses SPECIAL_CODES where known.
     """
     clean = label.strip()
-    if clean in SPECIAL_CODES:
-        return SPECIAL_CODES[clean]
+    special = _SPECIAL_CODES_CF.get(clean.casefold())
+    if special is not None:
+        return special
 
     # generic: uppercase, non-alphanum -> _
-    base = re.sub(r"[^0-9a-zA-Z]+", "_", clean)
+    base = _NON_ALNUM_RE.sub("_", clean)
     base = base.strip("_")
     return base.upper()
 
 
+@lru_cache(maxsize=1024)
 def extract_region(label: str) -> Optional[str]:
     """
     Try to extract region/state from things like 'Bigha – Assam', 'Dhur-Bihar', 'Bigha-Uttarakhand-II'.
@@ -233,15 +296,23 @@ def extract_region(label: str) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=1024)
+def _city_for_label(label: str) -> Optional[str]:
+    """Representative city for the first region token found in a unit label, if any."""
+    match = _REGION_RE.search(label)
+    if match is None:
+        return None
+    return _REGION_TO_CITY_LC[match.group(0).lower()]
+
+
 def guess_city(from_label: str, to_label: str, default_city: str) -> str:
     """
     Guess a city based on region tokens in the unit names; fall back to default_city.
     """
-    candidates = [from_label, to_label]
-    for label in candidates:
-        for region_key, city in REGION_TO_CITY.items():
-            if region_key.lower() in label.lower():
-                return city
+    for label in (from_label, to_label):
+        city = _city_for_label(label)
+        if city is not None:
+            return city
     return default_city
 
 
@@ -275,7 +346,7 @@ def section_names_from_issues(issues: List[str]) -> Set[str]:
 
 # ---------- CORE BATCH LOGIC ----------
 
-def process_pair(
+async def process_pair_async(
     row_label: str,
     col_label: str,
     factor: float,
@@ -283,20 +354,20 @@ def process_pair(
     default_city: str,
     locale: str,
     site_code: str,
-    mongo_collection,
     auto_fix_lengths: bool,
     max_fix_passes: int,
     preview_only: bool,
     html_out_dir: Optional[Path],
-) -> Tuple[bool, List[str]]:
+    now: datetime,
+) -> Tuple[bool, List[str], Optional[UpdateOne]]:
     
     """
-    Generate, validate (and optionally auto-fix) one child page for (row_label -> col_label),
-    then upsert into Mongo.
-    Returns (success_flag, issues_list).
+    Generate, validate (and optionally auto-fix) one child page for (row_label -> col_label).
+    Returns (success_flag, issues_list, upsert_op); upsert_op is None in preview-only mode
+    and is otherwise left to the caller to flush in bulk.
     """
-    from_label = row_label.strip()
-    to_label = col_label.strip()
+    from_label = row_label
+    to_label = col_label
 
     from_code = normalize_unit_code(from_label)
     to_code = normalize_unit_code(to_label)
@@ -325,7 +396,7 @@ def process_pair(
         ),
     }
 
-    ai_output: ChildPageOutput = generate_child_content(payload)
+    ai_output: ChildPageOutput = await agenerate_child_content(payload)
 
     # First validation
     issues = validate_child_lengths(ai_output)
@@ -335,42 +406,31 @@ def process_pair(
             if not issues:
                 break
 
-            section_names = section_names_from_issues(issues)
+            section_names = sorted(section_names_from_issues(issues))
+
+            # All failing sections of this pass go out in one bundled request
+            regen = await aregenerate_sections_bundle(
+                section_names,
+                from_unit_code=from_code,
+                to_unit_code=to_code,
+                from_unit_label=from_label,
+                to_unit_label=to_label,
+                factor_to_unit=factor,
+                from_unit_region=from_region,
+                to_unit_region=to_region,
+                city_name=city_name,
+            )
             for section in section_names:
-                regen = regenerate_section(
-                    section=section,
-                    from_unit_code=from_code,
-                    to_unit_code=to_code,
-                    from_unit_label=from_label,
-                    to_unit_label=to_label,
-                    factor_to_unit=factor,
-                    from_unit_region=from_region,
-                    to_unit_region=to_region,
-                    city_name=city_name,
-                )
-
-                if section == "why_convert":
-                    ai_output.why_convert_section_html = regen[
-                        "why_convert_section_html"
-                    ]
-                elif section == "from_unit":
-                    ai_output.from_unit_section_html = regen[
-                        "from_unit_section_html"
-                    ]
-                elif section == "to_unit":
-                    ai_output.to_unit_section_html = regen[
-                        "to_unit_section_html"
-                    ]
-                elif section == "examples":
-                    ai_output.examples_section_html = regen[
-                        "examples_section_html"
-                    ]
-                elif section == "technical":
-                    ai_output.technical_details_html = regen[
-                        "technical_details_html"
-                    ]
-                elif section == "faq_block":
-                    ai_output.faqs = regen["faqs"]
+                key = SECTION_OUTPUT_KEYS[section]
+                value = regen[key]
+                if key == "faqs":
+                    # Plain attribute assignment skips validation, so build the items here
+                    try:
+                        value = [FAQItem(**faq) for faq in value]
+                    except (TypeError, ValidationError):
+                        # Malformed entries: keep the old FAQs, the issue stays for the next pass
+                        continue
+                setattr(ai_output, key, value)
 
             # Re-validate after regenerations
             issues = validate_child_lengths(ai_output)
@@ -390,15 +450,11 @@ def process_pair(
         to_unit_label=to_label,
         locale=locale,
         site_code=site_code,
+        now=now,
     )
 
-        # Build Mongo document
-    slug = build_slug(from_code, to_code)
-    url_path = f"/area-convertor/{slug}"
-
     # Optional HTML preview output
     if html_out_dir is not None:
-        html_out_dir.mkdir(parents=True, exist_ok=True)
         html_str = render_child_html_page(
             ai_output,
             slug=slug,
@@ -410,13 +466,13 @@ def process_pair(
             url_path=url_path,
         )
         html_path = html_out_dir / f"{slug}.html"
-        html_path.write_text(html_str, encoding="utf-8")
-        print(f"HTML preview written to {html_path}")
+        _io_pool.submit(write_preview, html_path, html_str)
 
+    upsert_op: Optional[UpdateOne] = None
     if preview_only:
-        print(json.dumps(mongo_doc, indent=2, ensure_ascii=False, default=str))
+        log(json.dumps(mongo_doc, indent=2, ensure_ascii=False, default=str))
     else:
-        mongo_collection.update_one(
+        upsert_op = UpdateOne(
             {
                 "parentSlug": mongo_doc["parentSlug"],
                 "slug": mongo_doc["slug"],
@@ -428,7 +484,109 @@ def process_pair(
         )
 
     success = not issues
-    return success, issues
+    return success, issues, upsert_op
+
+
+def flush_upserts(collection, ops: List[UpdateOne]) -> None:
+    """Send pending upserts in one unordered bulk_write and clear the buffer."""
+    if not ops:
+        return
+    collection.bulk_write(ops, ordered=False)
+    ops.clear()
+
+
+async def run_batch(
+    pairs: List[Tuple[str, str, float]],
+    *,
+    args: argparse.Namespace,
+    collection,
+    html_out_dir: Optional[Path],
+) -> Tuple[int, int, int, int]:
+    """
+    Generate all pairs with at most args.concurrency OpenAI calls in flight.
+    Returns (processed, successes, failures, errors); failures still have length
+    issues, errors are pairs that raised and were not generated at all.
+    """
+    semaphore = asyncio.Semaphore(args.concurrency)
+    # One createdAt/updatedAt for the whole batch
+    batch_now = datetime.utcnow()
+
+    async def run_one(row_label: str, col_label: str, factor: float):
+        error: Optional[str] = None
+        result = (False, [], None)
+        async with semaphore:
+            try:
+                result = await process_pair_async(
+                    row_label=row_label,
+                    col_label=col_label,
+                    factor=factor,
+                    default_city=args.default_city,
+                    locale=args.default_locale,
+                    site_code=args.site_code,
+                    auto_fix_lengths=args.auto_fix_lengths,
+                    max_fix_passes=args.max_fix_passes,
+                    preview_only=args.preview_only,
+                    html_out_dir=html_out_dir,
+                    now=batch_now,
+                )
+            except Exception as exc:
+                # One bad pair (API error, unparsable reply, ...) must not stop the batch
+                error = f"{type(exc).__name__}: {exc}"
+        return row_label, col_label, factor, result, error
+
+    processed = 0
+    successes = 0
+    failures = 0
+    errors = 0
+    pending_ops: List[UpdateOne] = []
+
+    tasks = [asyncio.create_task(run_one(*pair)) for pair in pairs]
+    # Whatever happens, pages that were already generated still get written
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            row_label, col_label, factor, result, error = await next_done
+            success, issues, upsert_op = result
+
+            # Only this coroutine touches the buffer, so it needs no lock
+            if upsert_op is not None:
+                pending_ops.append(upsert_op)
+                if len(pending_ops) >= args.bulk_size:
+                    await asyncio.to_thread(flush_upserts, collection, pending_ops)
+
+            processed += 1
+            lines = [
+                f"\n=== Processed pair #{processed}: "
+                f"{row_label} -> {col_label} "
+                f"(factor={factor}) ==="
+            ]
+            if error is not None:
+                errors += 1
+                lines.append(f"Status: Error, page not generated: {error}")
+            elif success:
+                successes += 1
+                lines.append("Status: OK (all sections within desired length ranges).")
+            else:
+                failures += 1
+                lines.append("Status: Has remaining length issues:")
+                lines.extend(f" - {issue}" for issue in issues)
+            log("\n".join(lines))
+    finally:
+        await asyncio.to_thread(flush_upserts, collection, pending_ops)
+    return processed, successes, failures, errors
+
+
+def _int_at_least(minimum: int):
+    """argparse type for integers >= minimum."""
+
+    def parse(value: str) -> int:
+        number = int(value)
+        if number < minimum:
+            raise argparse.ArgumentTypeError(f"must be >= {minimum}, got {number}")
+        return number
+
+    # argparse names the type in its error message ("invalid int value: 'x'")
+    parse.__name__ = "int"
+    return parse
 
 
 def main():
@@ -505,91 +663,102 @@ def main():
         default="",
         help="If set, write an HTML preview file for each generated child page into this directory.",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=_int_at_least(1),
+        default=8,
+        help="Max number of pairs with an OpenAI request in flight at once.",
+    )
+    parser.add_argument(
+        "--bulk_size",
+        type=_int_at_least(1),
+        default=500,
+        help="Number of Mongo upserts to batch into a single bulk_write.",
+    )
+    parser.add_argument(
+        "--mongo_pool_size",
+        type=_int_at_least(0),
+        default=0,
+        help="Max Mongo connection pool size (0 = twice --concurrency).",
+    )
+    parser.add_argument(
+        "--fast_insert",
+        action="store_true",
+        help="Write with w=0 (unacknowledged). Safe for re-runs since every write is an idempotent upsert.",
+    )
 
     args = parser.parse_args()
 
     html_out_dir: Optional[Path] = None
     if args.html_out_dir:
         html_out_dir = Path(args.html_out_dir).expanduser()
+        html_out_dir.mkdir(parents=True, exist_ok=True)
 
     # Load CSV
     csv_path = Path(args.csv_path)
     if not csv_path.exists():
         raise SystemExit(f"CSV not found at: {csv_path}")
 
-    df = pd.read_csv(csv_path)
-
-    # Assume first column is the row label (like 'Unnamed: 0')
+    # Peek at the header so dtypes can be fixed up front instead of inferred per column.
+    # Factors stay float64: float32 would leak digits like 0.0016528925625607371 into prompts.
+    header = pd.read_csv(csv_path, nrows=0)
+    dtypes = {header.columns[0]: "string", **{c: "float64" for c in header.columns[1:]}}
+    try:
+        df = pd.read_csv(csv_path, dtype=dtypes)
+    except ValueError as exc:
+        raise SystemExit(f"Non-numeric conversion factor in {csv_path}: {exc}")
+
+    # Assume first column is the row label (like 'Unnamed: 0').
+    # Labels are stripped once here; everything downstream uses them as-is.
+    # Blank label cells (e.g. trailing ",,,," rows from spreadsheet exports) load as
+    # pd.NA, which numpy cannot compare, so they become "" and are skipped below.
     row_label_col = df.columns[0]
-    row_labels = df[row_label_col].tolist()
-    col_labels = df.columns[1:].tolist()
+    row_labels = df[row_label_col].str.strip().fillna("").to_numpy(dtype=object)
+    col_labels = df.columns[1:].str.strip().to_numpy(dtype=object)
+
+    # Numeric factor block; empty cells are NaN and are skipped below
+    factors = df.iloc[:, 1:].to_numpy(dtype=float, na_value=np.nan)
+
+    # Skip NaN/zero factors, unlabeled rows and self-conversions with a single mask
+    valid = (
+        np.isfinite(factors)
+        & (factors != 0)
+        & (row_labels != "")[:, None]
+        & (row_labels[:, None] != col_labels[None, :])
+    )
 
-    # Mongo client
-    client = MongoClient(args.mongo_uri)
+    # Collect every valid (row, col, factor) pair up front
+    pairs: List[Tuple[str, str, float]] = [
+        (row_labels[i], col_labels[j], float(factors[i, j]))
+        for i, j in np.argwhere(valid)
+    ]
+
+    if args.limit_pairs:
+        pairs = pairs[: args.limit_pairs]
+
+    # Mongo client, shared across the whole batch
+    client = MongoClient(
+        args.mongo_uri,
+        maxPoolSize=args.mongo_pool_size or args.concurrency * 2,
+        w=0 if args.fast_insert else 1,
+        retryWrites=True,
+    )
     db = client[args.db_name]
     collection = db[args.collection_name]
 
-    processed = 0
-    successes = 0
-    failures = 0
-
-    for i, row_label in enumerate(row_labels):
-        for col_label in col_labels:
-            factor = df.at[i, col_label]
-
-            # Skip NaN or zero factors
-            try:
-                if factor is None or (isinstance(factor, float) and math.isnan(factor)):
-                    continue
-            except TypeError:
-                continue
-
-            if isinstance(factor, (int, float)) and factor == 0:
-                continue
-
-            # Skip self-conversion
-            if str(row_label).strip() == str(col_label).strip():
-                continue
-
-            processed += 1
-            if args.limit_pairs and processed > args.limit_pairs:
-                break
-
-            print(
-                f"\n=== Processing pair #{processed}: "
-                f"{row_label.strip()} -> {col_label.strip()} "
-                f"(factor={factor}) ==="
-            )
-            success, issues = process_pair(
-                row_label=row_label,
-                col_label=col_label,
-                factor=float(factor),
-                default_city=args.default_city,
-                locale=args.default_locale,
-                site_code=args.site_code,
-                mongo_collection=collection,
-                auto_fix_lengths=args.auto_fix_lengths,
-                max_fix_passes=args.max_fix_passes,
-                preview_only=args.preview_only,
-                html_out_dir=html_out_dir,
-            )
-
-            if success:
-                successes += 1
-                print("Status: OK (all sections within desired length ranges).")
-            else:
-                failures += 1
-                print("Status: Has remaining length issues:")
-                for issue in issues:
-                    print(f" - {issue}")
-
-        if args.limit_pairs and processed >= args.limit_pairs:
-            break
+    try:
+        processed, successes, failures, errors = asyncio.run(
+            run_batch(pairs, args=args, collection=collection, html_out_dir=html_out_dir)
+        )
+    finally:
+        # Let queued preview writes land before exiting
+        _io_pool.shutdown(wait=True)
 
     print("\n===== BATCH SUMMARY =====")
     print(f"Total pairs processed: {processed}")
     print(f"Successful (fully valid): {successes}")
     print(f"With remaining issues:   {failures}")
+    print(f"Errors (not generated):  {errors}")
 
 
 if __name__ == "__main__":
@@ -1,9 +1,12 @@
 # src/generator.py
 import json
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
-from openai import OpenAI
+import orjson
+from openai import AsyncOpenAI, OpenAI
 from dotenv import load_dotenv
 
 from .config.settings import settings
@@ -20,11 +23,16 @@ from .validation import validate_child_lengths
 load_dotenv()
 
 client = OpenAI(api_key=settings.openai_api_key)
+async_client = AsyncOpenAI(api_key=settings.openai_api_key)
 
 BASE_DIR = Path(__file__).resolve().parent
 PROMPTS_DIR = BASE_DIR / "prompts"
 
+# {{placeholder}} markers used by the prompt templates
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
 
+
+@lru_cache(maxsize=None)
 def load_prompt(template_name: Literal["landing", "child"]) -> str:
     file_map = {
         "landing": PROMPTS_DIR / "landing_prompt.txt",
@@ -35,33 +43,21 @@ def load_prompt(template_name: Literal["landing", "child"]) -> str:
 
 
 def render_child_prompt(template: str, child_input: ChildPageInput) -> str:
-    text = template
-    text = text.replace("{{from_unit_code}}", child_input.from_unit_code)
-    text = text.replace("{{from_unit_label}}", child_input.from_unit_label)
-    text = text.replace("{{to_unit_code}}", child_input.to_unit_code)
-    text = text.replace("{{to_unit_label}}", child_input.to_unit_label)
-
-    text = text.replace(
-        "{{factor_to_unit}}",
-        str(child_input.factor_to_unit) if child_input.factor_to_unit is not None else "N/A",
-    )
-    text = text.replace(
-        "{{from_unit_region}}",
-        child_input.from_unit_region or "Pan-India",
-    )
-    text = text.replace(
-        "{{to_unit_region}}",
-        child_input.to_unit_region or "Pan-India",
-    )
-    text = text.replace(
-        "{{city_name}}",
-        child_input.city_name or "a major Indian city",
-    )
-    text = text.replace(
-        "{{direction_note}}",
-        child_input.direction_note or "",
-    )
-    return text
+    subs = {
+        "from_unit_code": child_input.from_unit_code,
+        "from_unit_label": child_input.from_unit_label,
+        "to_unit_code": child_input.to_unit_code,
+        "to_unit_label": child_input.to_unit_label,
+        "factor_to_unit": (
+            str(child_input.factor_to_unit) if child_input.factor_to_unit is not None else "N/A"
+        ),
+        "from_unit_region": child_input.from_unit_region or "Pan-India",
+        "to_unit_region": child_input.to_unit_region or "Pan-India",
+        "city_name": child_input.city_name or "a major Indian city",
+        "direction_note": child_input.direction_note or "",
+    }
+    # Single pass over the template; unknown placeholders are left as-is
+    return _PLACEHOLDER_RE.sub(lambda m: subs.get(m.group(1), m.group(0)), template)
 
 
 def render_landing_prompt(template: str, landing_input: LandingPageInput) -> str:
@@ -80,7 +76,19 @@ def call_model(prompt: str) -> dict:
     )
     # Get the first text output
     text = response.output[0].content[0].text
-    return json.loads(text)
+    return orjson.loads(text)
+
+
+async def acall_model(prompt: str) -> dict:
+    """
+    Async variant of call_model so many pages can be in flight on one event loop.
+    """
+    response = await async_client.responses.create(
+        model=settings.openai_model,
+        input=prompt,
+    )
+    text = response.output[0].content[0].text
+    return orjson.loads(text)
 
 
 def generate_landing_content(params: dict) -> LandingPageOutput:
@@ -92,13 +100,22 @@ def generate_landing_content(params: dict) -> LandingPageOutput:
 
 
 def generate_child_content(params: dict) -> ChildPageOutput:
-    child_input = ChildPageInput(**params)
+    # params are built by our own CLI/batch code, so skip re-validating them
+    child_input = ChildPageInput.model_construct(**params)
     template = load_prompt("child")
     prompt = render_child_prompt(template, child_input)
     raw = call_model(prompt)
     return ChildPageOutput(**raw)
 
 
+async def agenerate_child_content(params: dict) -> ChildPageOutput:
+    child_input = ChildPageInput.model_construct(**params)
+    template = load_prompt("child")
+    prompt = render_child_prompt(template, child_input)
+    raw = await acall_model(prompt)
+    return ChildPageOutput(**raw)
+
+
 if __name__ == "__main__":
     import argparse
 
@@ -61,8 +61,8 @@ def build_landing_mongo_doc(
         },
         "faqs": [
             {
-                "question": faq["question"],
-                "answerHtml": faq["answer_html"],
+                "question": faq.question,
+                "answerHtml": faq.answer_html,
                 "isActive": True,
                 "sortOrder": idx + 1,
             }
@@ -88,11 +88,13 @@ def build_child_mongo_doc(
     status: str = "draft",
     version: int = 1,
     last_updated_display_date: datetime | None = None,
+    now: datetime | None = None,
 ) -> Dict[str, Any]:
     """
     Shapes the AI output into the Mongo document structure for area_converter_child_pages.
+    Pass `now` to stamp a whole batch with one timestamp; defaults to the current UTC time.
     """
-    now = datetime.utcnow()
+    now = now or datetime.utcnow()
     last_display = last_updated_display_date or now
 
     doc: Dict[str, Any] = {
@@ -137,8 +139,8 @@ def build_child_mongo_doc(
         ],
         "faqs": [
             {
-                "question": faq["question"],
-                "answerHtml": faq["answer_html"],
+                "question": faq.question,
+                "answerHtml": faq.answer_html,
                 "isActive": True,
                 "sortOrder": idx + 1,
             }
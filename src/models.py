@@ -1,11 +1,18 @@
 # src/models.py
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List, Literal, Optional
 
 
 PageType = Literal["landing", "child"]
 
 
+class FAQItem(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    question: str
+    answer_html: str
+
+
 class LandingPageInput(BaseModel):
     page_type: Literal["landing"] = "landing"
     # You can extend later with more SEO hints if needed
@@ -24,7 +31,7 @@ class LandingPageOutput(BaseModel):
 
     major_units_copy_html: str
     formulas_section_html: str
-    faqs: List[dict]  # [{question, answer_html}, ...]
+    faqs: List[FAQItem]
 
 
 class ChildPageInput(BaseModel):
@@ -55,4 +62,4 @@ class ChildPageOutput(BaseModel):
     to_unit_section_html: str
     examples_section_html: str
     technical_details_html: str
-    faqs: List[dict]
\ No newline at end of file
+    faqs: List[FAQItem]
\ No newline at end of file
@@ -1,10 +1,17 @@
 # src/section_regen.py
+import asyncio
+import hashlib
 import json
+import os
+import re
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import Any, Dict, List, Literal, Optional
 
+import orjson
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from .config.settings import settings
 
@@ -14,10 +21,14 @@ if not settings.openai_api_key:
     raise RuntimeError("OPENAI_API_KEY is not set.")
 
 client = OpenAI(api_key=settings.openai_api_key)
+aclient = AsyncOpenAI(api_key=settings.openai_api_key)
 
 BASE_DIR = Path(__file__).resolve().parent
 PROMPTS_DIR = BASE_DIR / "prompts"
 
+# Single-section regenerations are cached here, keyed on model + full prompt
+CACHE_DIR = Path.home() / ".cache" / "area-converter-ai"
+
 
 SectionName = Literal[
     "why_convert",
@@ -28,15 +39,114 @@ SectionName = Literal[
     "faq_block",
 ]
 
-
+# JSON key the model returns (and ChildPageOutput field it replaces) for each section
+SECTION_OUTPUT_KEYS: Dict[str, str] = {
+    "why_convert": "why_convert_section_html",
+    "from_unit": "from_unit_section_html",
+    "to_unit": "to_unit_section_html",
+    "examples": "examples_section_html",
+    "technical": "technical_details_html",
+    "faq_block": "faqs",
+}
+
+# small description per section
+_SECTION_INSTRUCTIONS: Dict[str, str] = {
+    "why_convert": "Regenerate the WHY CONVERT section html, respecting the 220–260 word constraint.",
+    "from_unit": "Regenerate the FROM UNIT section html ('What is FROM'), 230–290 words, with history and usage domains.",
+    "to_unit": "Regenerate the TO UNIT section html ('What is TO'), 230–290 words, with history and usage domains.",
+    "examples": "Regenerate the EXAMPLES section html, 90–200 words, with 3–5 practical conversions.",
+    "technical": "Regenerate the TECHNICAL DETAILS section html, 150–200 words, with a clear explanation.",
+    "faq_block": "Regenerate the entire FAQ block as an array of 4–5 FAQs (question + answer_html), each answer 90–140 words.",
+}
+
+
+@lru_cache(maxsize=1)
 def load_base_child_prompt() -> str:
     """We reuse the main child prompt as context, then ask to regenerate just one section."""
     path = PROMPTS_DIR / "child_prompt.txt"
     return path.read_text(encoding="utf-8")
 
 
-def build_section_regen_prompt(
-    section: SectionName,
+# Identical for every section request, so it sits in the shared prompt prefix
+_SECTION_OUTPUT_FORMAT = """Output format:
+Return a single JSON object with:
+- If section = "why_convert": key "why_convert_section_html"
+- If section = "from_unit": key "from_unit_section_html"
+- If section = "to_unit": key "to_unit_section_html"
+- If section = "examples": key "examples_section_html"
+- If section = "technical": key "technical_details_html"
+- If section = "faq_block": key "faqs" (array of objects with question and answer_html)
+
+Do NOT wrap the JSON in backticks."""
+
+
+# child_prompt.txt headings look like "-----\nTITLE\n-----"
+_PROMPT_HEADING_RE = re.compile(r"^-{10,}\n(.+)\n-{10,}\n", re.MULTILINE)
+
+# Page-wide rules every section must follow; the per-section specs are added separately
+_STYLE_DIGEST_HEADINGS = (
+    "GLOBAL RULES",
+    "LOCALISATION & GEOGRAPHIC USAGE",
+    "FALLBACK & EDGE-CASE BEHAVIOUR",
+)
+_HTML_RULES_MARKER = "For all *_html fields:"
+
+
+@lru_cache(maxsize=1)
+def _child_prompt_blocks() -> Dict[str, str]:
+    """child_prompt.txt split into {heading: body}, plus the intro under key ""."""
+    text = load_base_child_prompt()
+    matches = list(_PROMPT_HEADING_RE.finditer(text))
+    if not matches:
+        return {"": text.strip()}
+
+    blocks = {"": text[: matches[0].start()].strip()}
+    for match, following in zip(matches, matches[1:] + [None]):
+        end = following.start() if following is not None else len(text)
+        blocks[match.group(1).strip()] = text[match.end():end].strip()
+    return blocks
+
+
+@lru_cache(maxsize=1)
+def build_style_digest() -> str:
+    """
+    The style-defining parts of child_prompt.txt (writer role, global, localisation and
+    fallback rules, HTML conventions) without the full-page section specs, so section
+    regeneration sends about a third of the base prompt's tokens.
+    """
+    blocks = _child_prompt_blocks()
+    intro = blocks[""]
+    parts = [intro.splitlines()[0]] if intro else []
+    parts += [f"{heading}:\n{blocks[heading]}" for heading in _STYLE_DIGEST_HEADINGS if heading in blocks]
+
+    output_format = blocks.get("OUTPUT FORMAT", "")
+    if _HTML_RULES_MARKER in output_format:
+        parts.append(output_format[output_format.index(_HTML_RULES_MARKER):])
+    return "\n\n".join(parts)
+
+
+def _section_brief(section: SectionName) -> str:
+    """The block of child_prompt.txt that specifies this section, or "" if not found."""
+    marker = f"Output key: {SECTION_OUTPUT_KEYS[section]}"
+    for heading, body in _child_prompt_blocks().items():
+        if marker in body:
+            return f"{heading}:\n{body}"
+    return ""
+
+
+@lru_cache(maxsize=2)
+def section_regen_prompt_prefix(full_context: bool = False) -> str:
+    """
+    Static leading part of every section-regeneration prompt. Provider-side prompt
+    caching only matches exact prefixes, so nothing request-specific may appear here.
+    By default this is the style digest; full_context=True sends the whole child
+    prompt instead (useful when debugging style drift).
+    """
+    base = load_base_child_prompt() if full_context else build_style_digest()
+    return f"{base}\n\n{_SECTION_OUTPUT_FORMAT}\n\n"
+
+
+def _unit_context_block(
     *,
     from_unit_code: str,
     to_unit_code: str,
@@ -47,40 +157,12 @@ def build_section_regen_prompt(
     to_unit_region: str | None,
     city_name: str | None,
 ) -> str:
-    base_context = load_base_child_prompt()
-
-    directional_note = (
-        f"This is a SECTION REGENERATION request. "
-        f"You must ONLY regenerate the section '{section}' for a page that converts "
-        f"FROM {from_unit_label} TO {to_unit_label}. "
-        f"Do not change the direction and do not generate the full JSON. "
-        f"Return ONLY a JSON object with a single key matching the section."
-    )
-
-    # small description per section
-    section_instruction_map = {
-        "why_convert": "Regenerate the WHY CONVERT section html, respecting the 220–260 word constraint.",
-        "from_unit": "Regenerate the FROM UNIT section html ('What is FROM'), 230–290 words, with history and usage domains.",
-        "to_unit": "Regenerate the TO UNIT section html ('What is TO'), 230–290 words, with history and usage domains.",
-        "examples": "Regenerate the EXAMPLES section html, 90–200 words, with 3–5 practical conversions.",
-        "technical": "Regenerate the TECHNICAL DETAILS section html, 150–200 words, with a clear explanation.",
-        "faq_block": "Regenerate the entire FAQ block as an array of 4–5 FAQs (question + answer_html), each answer 90–140 words.",
-    }
-
-    section_note = section_instruction_map[section]
-
     factor_str = "N/A" if factor_to_unit is None else str(factor_to_unit)
     from_region = from_unit_region or "Pan-India"
     to_region = to_unit_region or "Pan-India"
     city = city_name or "a major Indian city"
 
-    # We don't need whole base prompt, but including ensures same style.
-    return f"""
-{base_context}
-
-{directional_note}
-
-Use the following context:
+    return f"""Use the following context:
 - FROM unit code: {from_unit_code}
 - FROM unit label: {from_unit_label}
 - FROM unit region: {from_region}
@@ -88,30 +170,127 @@ Use the following context:
 - TO unit label: {to_unit_label}
 - TO unit region: {to_region}
 - Approximate factor (1 FROM ≈ X TO): {factor_str}
-- Primary city context: {city}
+- Primary city context: {city}"""
 
-{section_note}
 
-Output format:
-Return a single JSON object with:
-- If section = "why_convert": key "why_convert_section_html"
-- If section = "from_unit": key "from_unit_section_html"
-- If section = "to_unit": key "to_unit_section_html"
-- If section = "examples": key "examples_section_html"
-- If section = "technical": key "technical_details_html"
-- If section = "faq_block": key "faqs" (array of objects with question and answer_html)
+def build_section_regen_prompt(
+    section: SectionName,
+    *,
+    from_unit_code: str,
+    to_unit_code: str,
+    from_unit_label: str,
+    to_unit_label: str,
+    factor_to_unit: float | None,
+    from_unit_region: str | None,
+    to_unit_region: str | None,
+    city_name: str | None,
+    full_context: bool = False,
+) -> str:
+    request_note = (
+        f"This is a SECTION REGENERATION request for the section '{section}'. "
+        f"Do not generate the full JSON. "
+        f"Return ONLY a JSON object with a single key matching the section."
+    )
+    directional_note = (
+        f"You must ONLY regenerate the section '{section}' for a page that converts "
+        f"FROM {from_unit_label} TO {to_unit_label}. Do not change the direction."
+    )
 
-Do NOT wrap the JSON in backticks.
-    """.strip()
+    context = _unit_context_block(
+        from_unit_code=from_unit_code,
+        to_unit_code=to_unit_code,
+        from_unit_label=from_unit_label,
+        to_unit_label=to_unit_label,
+        factor_to_unit=factor_to_unit,
+        from_unit_region=from_unit_region,
+        to_unit_region=to_unit_region,
+        city_name=city_name,
+    )
 
+    # The full prompt already contains every section spec; the digest needs this one added
+    brief = "" if full_context else f"{_section_brief(section)}\n\n"
 
-def call_model(prompt: str) -> dict:
-    response = client.responses.create(
-        model=settings.openai_model,
-        input=prompt,
+    # Brief, instruction and request note are the same for every pair, so they extend the
+    # cached prefix (the digest alone is under the 1024-token caching minimum); pair data goes last
+    return f"""{section_regen_prompt_prefix(full_context)}{brief}{_SECTION_INSTRUCTIONS[section]}
+
+{request_note}
+
+{directional_note}
+
+{context}"""
+
+
+def build_multi_section_prompt(
+    sections: List[SectionName],
+    *,
+    from_unit_code: str,
+    to_unit_code: str,
+    from_unit_label: str,
+    to_unit_label: str,
+    factor_to_unit: float | None,
+    from_unit_region: str | None,
+    to_unit_region: str | None,
+    city_name: str | None,
+    full_context: bool = False,
+) -> str:
+    """Like build_section_regen_prompt, but asks for several sections in one JSON object."""
+    section_list = ", ".join(f"'{s}'" for s in sections)
+    key_list = ", ".join(f'"{SECTION_OUTPUT_KEYS[s]}"' for s in sections)
+    request_note = (
+        f"This is a SECTION REGENERATION request for the sections {section_list}. "
+        f"Do not generate the full JSON. "
+        f"Return ONLY a JSON object with exactly these keys: {key_list}."
+    )
+    directional_note = (
+        f"You must ONLY regenerate the sections {section_list} for a page that converts "
+        f"FROM {from_unit_label} TO {to_unit_label}. Do not change the direction."
     )
-    text = response.output[0].content[0].text
-    return json.loads(text)
+
+    context = _unit_context_block(
+        from_unit_code=from_unit_code,
+        to_unit_code=to_unit_code,
+        from_unit_label=from_unit_label,
+        to_unit_label=to_unit_label,
+        factor_to_unit=factor_to_unit,
+        from_unit_region=from_unit_region,
+        to_unit_region=to_unit_region,
+        city_name=city_name,
+    )
+    briefs = "" if full_context else "".join(f"{_section_brief(s)}\n\n" for s in sections)
+    instructions = "\n".join(f"- {_SECTION_INSTRUCTIONS[s]}" for s in sections)
+
+    # Same layout as build_section_regen_prompt: pair-independent text first
+    return f"""{section_regen_prompt_prefix(full_context)}{briefs}{instructions}
+
+{request_note}
+
+{directional_note}
+
+{context}"""
+
+
+def call_model(prompt: str) -> dict:
+    """Stream the reply, collecting text deltas as they arrive, and parse it once complete."""
+    chunks: List[str] = []
+    with client.responses.stream(model=settings.openai_model, input=prompt) as stream:
+        for event in stream:
+            if event.type == "response.output_text.delta":
+                chunks.append(event.delta)
+    return orjson.loads("".join(chunks))
+
+
+async def _acall_model(prompt: str, async_client: Optional[AsyncOpenAI] = None) -> dict:
+    """
+    Async call_model. The module-level aclient is bound to the first event loop that
+    uses it, so code that starts its own loop should pass a client created inside it.
+    """
+    chunks: List[str] = []
+    async with (async_client or aclient).responses.stream(model=settings.openai_model, input=prompt) as stream:
+        async for event in stream:
+            if event.type == "response.output_text.delta":
+                chunks.append(event.delta)
+    return orjson.loads("".join(chunks))
 
 
 def regenerate_section(
@@ -125,6 +304,80 @@ def regenerate_section(
     from_unit_region: str | None,
     to_unit_region: str | None,
     city_name: str | None,
+    use_cache: bool = True,
+    full_context: bool = False,
+) -> dict:
+    """
+    Regenerate one section. With use_cache, identical requests (same model and prompt,
+    so any edit to child_prompt.txt invalidates) are answered from CACHE_DIR.
+    """
+    prompt = build_section_regen_prompt(
+        section,
+        from_unit_code=from_unit_code,
+        to_unit_code=to_unit_code,
+        from_unit_label=from_unit_label,
+        to_unit_label=to_unit_label,
+        factor_to_unit=factor_to_unit,
+        from_unit_region=from_unit_region,
+        to_unit_region=to_unit_region,
+        city_name=city_name,
+        full_context=full_context,
+    )
+    if not use_cache:
+        return call_model(prompt)
+
+    key = SECTION_OUTPUT_KEYS[section]
+    cache_path = _cache_path(prompt)
+    cached = _read_cache(cache_path)
+    if isinstance(cached, dict) and key in cached:
+        return cached
+    out = call_model(prompt)
+    # Only keep usable replies, so one bad generation isn't replayed on every run
+    if isinstance(out, dict) and key in out:
+        _write_cache(cache_path, out)
+    return out
+
+
+def _cache_path(prompt: str) -> Path:
+    key = hashlib.blake2b(
+        f"{settings.openai_model}\n{prompt}".encode("utf-8"), digest_size=20
+    ).hexdigest()
+    return CACHE_DIR / f"{key}.json"
+
+
+def _read_cache(path: Path) -> Optional[dict]:
+    try:
+        return orjson.loads(path.read_bytes())
+    except (OSError, ValueError):
+        # Missing or unreadable entries are just cache misses
+        return None
+
+
+def _write_cache(path: Path, data: dict) -> None:
+    # Best effort: a read-only or missing cache dir must not lose a paid-for result
+    tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a private temp file, then rename, so readers never see a partial entry
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
+async def aregenerate_section(
+    section: SectionName,
+    *,
+    from_unit_code: str,
+    to_unit_code: str,
+    from_unit_label: str,
+    to_unit_label: str,
+    factor_to_unit: float | None,
+    from_unit_region: str | None,
+    to_unit_region: str | None,
+    city_name: str | None,
+    full_context: bool = False,
+    async_client: Optional[AsyncOpenAI] = None,
 ) -> dict:
     prompt = build_section_regen_prompt(
         section,
@@ -136,15 +389,194 @@ def regenerate_section(
         from_unit_region=from_unit_region,
         to_unit_region=to_unit_region,
         city_name=city_name,
+        full_context=full_context,
     )
-    return call_model(prompt)
+    return await _acall_model(prompt, async_client)
+
+
+async def aregenerate_sections(
+    specs: List[Dict[str, Any]],
+    *,
+    concurrency: int = 8,
+    async_client: Optional[AsyncOpenAI] = None,
+) -> List[dict]:
+    """
+    Regenerate several sections concurrently. Each spec holds the keyword arguments
+    of regenerate_section (including "section"); results come back in spec order.
+    At most `concurrency` requests are in flight, to stay under the account's rate limit.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _bounded(spec: Dict[str, Any]) -> dict:
+        async with semaphore:
+            return await aregenerate_section(**spec, async_client=async_client)
+
+    return await asyncio.gather(*(_bounded(spec) for spec in specs))
+
+
+def regenerate_sections(
+    specs: List[Dict[str, Any]],
+    *,
+    concurrency: int = 8,
+) -> List[dict]:
+    """Blocking wrapper around aregenerate_sections for scripts and the CLI."""
+
+    async def _run() -> List[dict]:
+        # A client per asyncio.run: its connection pool must not outlive the loop
+        async with AsyncOpenAI(api_key=settings.openai_api_key) as async_client:
+            return await aregenerate_sections(
+                specs, concurrency=concurrency, async_client=async_client
+            )
+
+    return asyncio.run(_run())
+
+
+async def aregenerate_sections_bundle(
+    sections: List[SectionName],
+    *,
+    from_unit_code: str,
+    to_unit_code: str,
+    from_unit_label: str,
+    to_unit_label: str,
+    factor_to_unit: float | None,
+    from_unit_region: str | None,
+    to_unit_region: str | None,
+    city_name: str | None,
+    full_context: bool = False,
+    async_client: Optional[AsyncOpenAI] = None,
+) -> dict:
+    """
+    Regenerate several sections of one page with a single request (one prompt prefix,
+    one rate-limit slot). Returns one dict holding the output key of every section.
+    Sections whose key is missing from the reply, or all of them if the reply is not
+    valid JSON, are retried as individual requests.
+    """
+    context = {
+        "from_unit_code": from_unit_code,
+        "to_unit_code": to_unit_code,
+        "from_unit_label": from_unit_label,
+        "to_unit_label": to_unit_label,
+        "factor_to_unit": factor_to_unit,
+        "from_unit_region": from_unit_region,
+        "to_unit_region": to_unit_region,
+        "city_name": city_name,
+        "full_context": full_context,
+    }
+    prompt = build_multi_section_prompt(sections, **context)
+    try:
+        out = await _acall_model(prompt, async_client)
+    except orjson.JSONDecodeError:
+        out = {}
+
+    missing = [s for s in sections if SECTION_OUTPUT_KEYS[s] not in out]
+    if missing:
+        specs = [{"section": s, **context} for s in missing]
+        for regen in await aregenerate_sections(specs, async_client=async_client):
+            out.update(regen)
+    return {SECTION_OUTPUT_KEYS[s]: out[SECTION_OUTPUT_KEYS[s]] for s in sections}
+
+
+def regenerate_sections_bundle(sections: List[SectionName], **context: Any) -> dict:
+    """Blocking wrapper around aregenerate_sections_bundle for scripts and the CLI."""
+
+    async def _run() -> dict:
+        # Same as regenerate_sections: the client must not outlive this loop
+        async with AsyncOpenAI(api_key=settings.openai_api_key) as async_client:
+            return await aregenerate_sections_bundle(
+                sections, **context, async_client=async_client
+            )
+
+    return asyncio.run(_run())
+
+
+def _batch_custom_id(spec: Dict[str, Any]) -> str:
+    return f"{spec['from_unit_code']}-to-{spec['to_unit_code']}-{spec['section']}".lower()
+
+
+def regenerate_sections_batch(specs: List[Dict[str, Any]]) -> str:
+    """
+    Submit section regenerations through the OpenAI Batch API (half the token price and a
+    separate rate-limit pool, results within 24h). Each spec holds the keyword arguments of
+    regenerate_section; optional context keys may be omitted. Returns the batch id.
+    """
+    # The Batch API rejects the whole file if any custom_id repeats
+    custom_ids = [_batch_custom_id(spec) for spec in specs]
+    duplicates = sorted(cid for cid, n in Counter(custom_ids).items() if n > 1)
+    if duplicates:
+        raise ValueError(
+            "Each pair and section may appear only once per batch "
+            f"(full_context does not count as a difference): {', '.join(duplicates)}"
+        )
+
+    lines = []
+    for spec, custom_id in zip(specs, custom_ids):
+        prompt = build_section_regen_prompt(
+            spec["section"],
+            from_unit_code=spec["from_unit_code"],
+            to_unit_code=spec["to_unit_code"],
+            from_unit_label=spec["from_unit_label"],
+            to_unit_label=spec["to_unit_label"],
+            factor_to_unit=spec.get("factor_to_unit"),
+            from_unit_region=spec.get("from_unit_region"),
+            to_unit_region=spec.get("to_unit_region"),
+            city_name=spec.get("city_name"),
+            full_context=spec.get("full_context", False),
+        )
+        request = {
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/responses",
+            "body": {"model": settings.openai_model, "input": prompt},
+        }
+        lines.append(json.dumps(request, ensure_ascii=False))
+
+    payload = ("\n".join(lines) + "\n").encode("utf-8")
+    batch_file = client.files.create(file=("section_regen_batch.jsonl", payload), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/responses",
+        completion_window="24h",
+    )
+    return batch.id
+
+
+def poll_batch(batch_id: str) -> Optional[Dict[str, dict]]:
+    """
+    Fetch the results of a batch submitted with regenerate_sections_batch.
+    Returns None while it is still running, otherwise {custom_id: section dict}.
+    Requests that failed inside a completed batch, or whose reply is not a valid JSON
+    object, are left out of the result.
+    """
+    batch = client.batches.retrieve(batch_id)
+    if batch.status in ("validating", "in_progress", "finalizing"):
+        return None
+    if batch.status != "completed":
+        raise RuntimeError(f"Batch {batch_id} ended with status '{batch.status}'.")
+    if not batch.output_file_id:
+        return {}
+
+    results: Dict[str, dict] = {}
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        response = record.get("response") or {}
+        if response.get("status_code") != 200:
+            continue
+        try:
+            text = response["body"]["output"][0]["content"][0]["text"]
+            results[record["custom_id"]] = orjson.loads(text)
+        except (KeyError, IndexError, TypeError, orjson.JSONDecodeError):
+            # One malformed reply must not cost the rest of the batch
+            continue
+    return results
 
 
 if __name__ == "__main__":
     import argparse
 
     parser = argparse.ArgumentParser(description="Regenerate a specific child-page section.")
-    parser.add_argument("--section", required=True, choices=[
+    parser.add_argument("--section", nargs="+", choices=[
         "why_convert",
         "from_unit",
         "to_unit",
@@ -153,26 +585,75 @@ if __name__ == "__main__":
         "faq_block",
     ])
 
-    parser.add_argument("--from_unit_code", required=True)
-    parser.add_argument("--to_unit_code", required=True)
-    parser.add_argument("--from_unit_label", required=True)
-    parser.add_argument("--to_unit_label", required=True)
+    parser.add_argument("--from_unit_code", type=str)
+    parser.add_argument("--to_unit_code", type=str)
+    parser.add_argument("--from_unit_label", type=str)
+    parser.add_argument("--to_unit_label", type=str)
     parser.add_argument("--factor_to_unit", type=float)
     parser.add_argument("--from_unit_region", type=str)
     parser.add_argument("--to_unit_region", type=str)
     parser.add_argument("--city_name", type=str)
+    parser.add_argument(
+        "--no-cache",
+        dest="no_cache",
+        action="store_true",
+        help="Always call the model, ignoring (and not updating) the on-disk cache.",
+    )
+    parser.add_argument(
+        "--full_context",
+        action="store_true",
+        help="Send the whole child prompt instead of the style digest (for debugging style drift).",
+    )
+
+    # Bulk backfills via the OpenAI Batch API
+    parser.add_argument(
+        "--batch_specs",
+        type=str,
+        help="JSONL file with one section spec per line; submits them as one OpenAI batch.",
+    )
+    parser.add_argument(
+        "--batch_id",
+        type=str,
+        help="Print the results of a previously submitted batch.",
+    )
 
     args = parser.parse_args()
 
-    out = regenerate_section(
-        section=args.section,
-        from_unit_code=args.from_unit_code,
-        to_unit_code=args.to_unit_code,
-        from_unit_label=args.from_unit_label,
-        to_unit_label=args.to_unit_label,
-        factor_to_unit=args.factor_to_unit,
-        from_unit_region=args.from_unit_region,
-        to_unit_region=args.to_unit_region,
-        city_name=args.city_name,
-    )
+    if args.batch_id:
+        results = poll_batch(args.batch_id)
+        if results is None:
+            raise SystemExit(f"Batch {args.batch_id} is still running; try again later.")
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+        raise SystemExit(0)
+
+    if args.batch_specs:
+        spec_lines = Path(args.batch_specs).read_text(encoding="utf-8").splitlines()
+        specs = [json.loads(line) for line in spec_lines if line.strip()]
+        try:
+            print(regenerate_sections_batch(specs))
+        except ValueError as exc:
+            raise SystemExit(str(exc))
+        raise SystemExit(0)
+
+    if not (args.section and args.from_unit_code and args.to_unit_code
+            and args.from_unit_label and args.to_unit_label):
+        raise SystemExit("You must provide --section plus from/to unit codes and labels.")
+
+    context = {
+        "from_unit_code": args.from_unit_code,
+        "to_unit_code": args.to_unit_code,
+        "from_unit_label": args.from_unit_label,
+        "to_unit_label": args.to_unit_label,
+        "factor_to_unit": args.factor_to_unit,
+        "from_unit_region": args.from_unit_region,
+        "to_unit_region": args.to_unit_region,
+        "city_name": args.city_name,
+        "full_context": args.full_context,
+    }
+
+    if len(args.section) == 1:
+        out = regenerate_section(section=args.section[0], use_cache=not args.no_cache, **context)
+    else:
+        # Several sections are requested together in one bundled prompt
+        out = regenerate_sections_bundle(args.section, **context)
     print(json.dumps(out, indent=2, ensure_ascii=False))
\ No newline at end of file
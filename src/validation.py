@@ -1,61 +1,84 @@
 # src/validation.py
-import re
-from typing import List
+from typing import Any, Dict, List, Union
 
 from .models import ChildPageOutput
 
+# (field, min words, max words) for each single-HTML section of a child page
+_SECTION_WORD_RANGES = (
+    ("why_convert_section_html", 220, 260),
+    ("from_unit_section_html", 230, 290),
+    ("to_unit_section_html", 230, 290),
+    ("examples_section_html", 90, 200),
+    ("technical_details_html", 150, 200),
+)
+_FAQ_ANSWER_WORD_RANGE = (90, 140)
+
+
+def _strip_and_count(html: str) -> int:
+    """
+    Count words outside of tags in one left-to-right pass.
+    An unterminated '<' swallows the rest of the string.
+    """
+    pieces: List[str] = []
+    pos = 0
+    while True:
+        start = html.find("<", pos)
+        if start == -1:
+            pieces.append(html[pos:])
+            break
+        pieces.append(html[pos:start])
+        end = html.find(">", start + 1)
+        if end == -1:
+            break
+        pos = end + 1
+    # Tags act as word separators; split() also collapses any whitespace run
+    return len(" ".join(pieces).split())
+
 
 def html_word_count(html: str) -> int:
     """Rough word count: strip tags and split on whitespace."""
     if not html:
         return 0
-    # remove tags
-    text = re.sub(r"<[^>]+>", " ", html)
-    # collapse whitespace
-    text = re.sub(r"\s+", " ", text).strip()
-    if not text:
-        return 0
-    return len(text.split(" "))
+    # Plain text (common for short FAQ answers) needs no tag scan
+    if "<" not in html:
+        return len(html.split())
+    return _strip_and_count(html)
 
 
-def validate_child_lengths(child: ChildPageOutput) -> List[str]:
-    """
-    Returns a list of human-readable validation issues for word-count ranges.
-    If list is empty, everything is within the desired ranges.
-    """
-    issues: List[str] = []
+def _length_issue(name: str, wc: int, lo: int, hi: int) -> str:
+    return f"{name}: {wc} words (expected {lo}–{hi})."
 
-    # Why convert
-    wc_why = html_word_count(child.why_convert_section_html)
-    if not (220 <= wc_why <= 260):
-        issues.append(f"why_convert_section_html: {wc_why} words (expected 220–260).")
 
-    # From unit
-    wc_from = html_word_count(child.from_unit_section_html)
-    if not (230 <= wc_from <= 290):
-        issues.append(f"from_unit_section_html: {wc_from} words (expected 230–290).")
+def _check_length(name: str, html: str, lo: int, hi: int) -> str | None:
+    """
+    Issue for one field, or None if its word count is in range.
+    Each word needs a character plus at least one separating character (space or
+    tag), so under 2*lo - 1 characters it cannot reach lo words and is rejected
+    without counting.
+    """
+    if len(html) < 2 * lo - 1:
+        return f"{name}: only {len(html)} characters (expected {lo}–{hi} words)."
+    wc = html_word_count(html)
+    if not lo <= wc <= hi:
+        return _length_issue(name, wc, lo, hi)
+    return None
 
-    # To unit
-    wc_to = html_word_count(child.to_unit_section_html)
-    if not (230 <= wc_to <= 290):
-        issues.append(f"to_unit_section_html: {wc_to} words (expected 230–290).")
 
-    # Examples
-    wc_examples = html_word_count(child.examples_section_html)
-    if not (90 <= wc_examples <= 200):
-        issues.append(f"examples_section_html: {wc_examples} words (expected 90–200).")
+def validate_child_lengths(child: Union[ChildPageOutput, Dict[str, Any]]) -> List[str]:
+    """
+    Returns a list of human-readable validation issues for word-count ranges.
+    If list is empty, everything is within the desired ranges.
+    Accepts the model or its raw JSON dict, so stored pages can be checked without parsing.
+    """
+    data = child if isinstance(child, dict) else child.model_dump()
 
-    # Technical
-    wc_tech = html_word_count(child.technical_details_html)
-    if not (150 <= wc_tech <= 200):
-        issues.append(f"technical_details_html: {wc_tech} words (expected 150–200).")
+    checks = [(name, data[name], lo, hi) for name, lo, hi in _SECTION_WORD_RANGES]
 
     # FAQ answers
-    for idx, faq in enumerate(child.faqs):
-        wc_ans = html_word_count(faq.get("answer_html", ""))
-        if not (90 <= wc_ans <= 140):
-            issues.append(
-                f"faqs[{idx}].answer_html: {wc_ans} words (expected 90–140)."
-            )
-
-    return issues
\ No newline at end of file
+    lo, hi = _FAQ_ANSWER_WORD_RANGE
+    checks.extend(
+        (f"faqs[{idx}].answer_html", faq.get("answer_html", ""), lo, hi)
+        for idx, faq in enumerate(data["faqs"])
+    )
+
+    return [issue for issue in (_check_length(*check) for check in checks) if issue]